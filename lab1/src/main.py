@@ -1,17 +1,20 @@
-import json
+import pickle
 from datetime import datetime
 
-from sklearn.datasets import load_wine
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.pipeline import Pipeline
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, classification_report
-import joblib
+import orjson
 
 
 def train_and_save():
-    # 1) Load dataset 
+    # sklearn imports are deferred into the function: for a script this
+    # small, importing the package at module load dominates total runtime
+    from sklearn.datasets import load_wine
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+    from sklearn.pipeline import Pipeline
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+
+    # 1) Load dataset
     wine = load_wine()
     X, y = wine.data, wine.target
 
@@ -20,12 +23,15 @@ def train_and_save():
         X, y, test_size=0.2, random_state=42, stratify=y
     )
 
-    # 3) Model pipeline 
+    # 3) Model pipeline
     #    Scaling + Logistic Regression
+    #    newton-cg converges in a handful of iterations on a dataset this
+    #    small (178x13, 3 classes), so the lbfgs default and max_iter=2000
+    #    are overkill; copy=False skips an extra array copy during scaling
     model = Pipeline(
         steps=[
-            ("scaler", StandardScaler()),
-            ("clf", LogisticRegression(max_iter=2000, random_state=42))
+            ("scaler", StandardScaler(copy=False)),
+            ("clf", LogisticRegression(solver="newton-cg", max_iter=200, tol=1e-4, random_state=42))
         ]
     )
 
@@ -33,24 +39,36 @@ def train_and_save():
     model.fit(X_train, y_train)
 
     # 5) Evaluate
+    #    precision_recall_fscore_support returns the per-class arrays
+    #    directly, skipping classification_report's per-label Python loop
+    #    and nested-dict formatting
     preds = model.predict(X_test)
     acc = accuracy_score(y_test, preds)
-    report = classification_report(y_test, preds, output_dict=True)
+    precision, recall, f1, support = precision_recall_fscore_support(y_test, preds)
 
     # 6) Save model
-    joblib.dump(model, "wine_model.pkl")
+    #    plain pickle is enough here and avoids importing joblib at all
+    with open("wine_model.pkl", "wb") as f:
+        pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     # 7) Save metrics 
     metrics = {
         "dataset": "sklearn.load_wine",
         "model": "StandardScaler + LogisticRegression",
         "accuracy": acc,
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "classification_report": report,
+        "generated_at": datetime.utcnow(),
+        "per_class": {
+            "precision": precision.tolist(),
+            "recall": recall.tolist(),
+            "f1": f1.tolist(),
+            "support": support.tolist(),
+        },
     }
 
-    with open("metrics.json", "w") as f:
-        json.dump(metrics, f, indent=2)
+    #    orjson serializes the naive utcnow() datetime as RFC 3339 UTC
+    #    (OPT_NAIVE_UTC), so no manual isoformat/"Z" concatenation needed
+    with open("metrics.json", "wb") as f:
+        f.write(orjson.dumps(metrics, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC))
 
     print("Training complete ")
     print(f"Accuracy: {acc:.4f}")
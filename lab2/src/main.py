@@ -1,6 +1,7 @@
-import json
 from pathlib import Path
 
+import orjson
+
 from planner import parse_request, schedule
 
 
@@ -8,15 +9,15 @@ def load_request(path: str) -> dict:
     p = Path(path)
     if not p.exists():
         raise FileNotFoundError(f"Input file not found: {path}")
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # parse straight from bytes; orjson is several times faster than stdlib json
+    return orjson.loads(p.read_bytes())
 
 
 def write_output(path: str, payload: dict) -> None:
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    with p.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    with p.open("wb") as f:
+        f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     print(f"Wrote schedule to: {path}")
 
 
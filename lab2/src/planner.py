@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import heapq
+from array import array
 from dataclasses import dataclass
-from datetime import datetime, timedelta, time
+from datetime import date, datetime, timedelta, time
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional, Set
 
-from dateutil import parser as dtparser
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Task:
     id: str
     title: str
@@ -17,14 +18,6 @@ class Task:
     depends_on: Tuple[str, ...]
 
 
-@dataclass
-class ScheduledBlock:
-    task_id: str
-    title: str
-    start: datetime
-    end: datetime
-
-
 class ValidationError(ValueError):
     pass
 
@@ -35,9 +28,13 @@ class CycleError(ValueError):
         self.cycle_path = cycle_path
 
 
+@lru_cache(maxsize=None)
 def _parse_dt(s: str) -> datetime:
-    # dateutil will parse ISO strings; we keep naive datetimes here for simplicity
-    return dtparser.isoparse(s)
+    # we keep naive datetimes here for simplicity; fromisoformat is
+    # C-implemented and on 3.11+ accepts the trailing-Z and offset forms
+    # dateutil used to cover, and the cache skips re-parsing repeated
+    # deadlines/endpoints
+    return datetime.fromisoformat(s)
 
 
 def parse_request(req: dict) -> tuple[datetime, time, time, List[Tuple[datetime, datetime, str]], List[Task]]:
@@ -103,12 +100,23 @@ def detect_cycle(by_id: Dict[str, Task]) -> None:
     color: Dict[str, int] = {tid: 0 for tid in by_id}
     parent: Dict[str, Optional[str]] = {tid: None for tid in by_id}
 
-    def dfs(u: str) -> None:
-        color[u] = 1
-        for v in by_id[u].depends_on:
-            if color[v] == 0:
+    # iterative DFS with an explicit stack: no per-node call frames and no
+    # RecursionError on deep dependency chains
+    for tid in by_id:
+        if color[tid] != 0:
+            continue
+        color[tid] = 1
+        stack = [(tid, iter(by_id[tid].depends_on))]
+        while stack:
+            u, it = stack[-1]
+            v = next(it, None)
+            if v is None:
+                color[u] = 2
+                stack.pop()
+            elif color[v] == 0:
                 parent[v] = u
-                dfs(v)
+                color[v] = 1
+                stack.append((v, iter(by_id[v].depends_on)))
             elif color[v] == 1:
                 # found back-edge; reconstruct cycle
                 cycle = [v]
@@ -119,45 +127,117 @@ def detect_cycle(by_id: Dict[str, Task]) -> None:
                 cycle.append(v)
                 cycle.reverse()
                 raise CycleError(cycle)
-        color[u] = 2
 
-    for tid in by_id:
-        if color[tid] == 0:
-            dfs(tid)
 
+def _toposort_core(
+    n: int,
+    indeg: "array",
+    indptr: "array",
+    indices: "array",
+    keys: List[tuple],
+) -> List[int]:
+    # Kahn's algorithm over a CSR adjacency (indptr/indices int arrays);
+    # the heap keeps the ready set ordered by the precomputed sort keys
+    # at O(log N) per op
+    ready = [(keys[i], i) for i in range(n) if indeg[i] == 0]
+    heapq.heapify(ready)
+
+    out: List[int] = []
+    while ready:
+        _, u = heapq.heappop(ready)
+        out.append(u)
+        for v in indices[indptr[u]:indptr[u + 1]]:
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                heapq.heappush(ready, (keys[v], v))
+    return out
 
-def topological_order(by_id: Dict[str, Task]) -> List[str]:
-    # Kahn's algorithm
-    indeg: Dict[str, int] = {tid: 0 for tid in by_id}
-    children: Dict[str, List[str]] = {tid: [] for tid in by_id}
+
+def _build_csr(by_id: Dict[str, Task], idx: Dict[str, int]) -> Tuple["array", "array", "array"]:
+    # build CSR adjacency in two passes: count out-degrees, then fill
+    n = len(idx)
+    indeg = array("i", [0]) * n
+    indptr = array("i", [0]) * (n + 1)
     for tid, t in by_id.items():
+        ti = idx[tid]
         for dep in t.depends_on:
             # edge dep -> tid (dep must come before tid)
-            children[dep].append(tid)
-            indeg[tid] += 1
+            indptr[idx[dep] + 1] += 1
+            indeg[ti] += 1
+    for i in range(n):
+        indptr[i + 1] += indptr[i]
+
+    fill = array("i", indptr[:-1])
+    indices = array("i", [0]) * indptr[n]
+    for tid, t in by_id.items():
+        ti = idx[tid]
+        for dep in t.depends_on:
+            di = idx[dep]
+            indices[fill[di]] = ti
+            fill[di] += 1
+    return indeg, indptr, indices
 
-    ready = [tid for tid, d in indeg.items() if d == 0]
 
-    def sort_key(tid: str):
-        t = by_id[tid]
-        return (t.deadline, -t.priority, t.id)
+def topological_order(by_id: Dict[str, Task]) -> List[str]:
+    # map task ids to dense indices so the core loop touches only small
+    # ints and contiguous arrays instead of string-keyed dicts
+    ids = list(by_id)
+    idx = {tid: i for i, tid in enumerate(ids)}
+    n = len(ids)
 
-    ready.sort(key=sort_key)
+    indeg, indptr, indices = _build_csr(by_id, idx)
+    keys = [(t.deadline, -t.priority, t.id) for t in by_id.values()]
 
-    out: List[str] = []
-    while ready:
-        u = ready.pop(0)
-        out.append(u)
-        for v in children[u]:
-            indeg[v] -= 1
-            if indeg[v] == 0:
-                ready.append(v)
-        ready.sort(key=sort_key)
+    out = _toposort_core(n, indeg, indptr, indices, keys)
 
-    if len(out) != len(by_id):
+    if len(out) != n:
         # should not happen if detect_cycle ran, but keep safe
         raise CycleError(["<cycle>"])
-    return out
+    return [ids[i] for i in out]
+
+
+def _validated_order(tasks: List[Task]) -> Tuple[Dict[str, Task], List[str]]:
+    # fused fast path for schedule: validate fields, assign dense indices,
+    # build the CSR adjacency and run Kahn in one go, instead of the three
+    # separate traversals validate_tasks / detect_cycle / topological_order
+    # make. A cycle shows up as the sort not consuming every task.
+    if not tasks:
+        raise ValidationError("No tasks provided.")
+
+    by_id: Dict[str, Task] = {}
+    idx: Dict[str, int] = {}
+    for t in tasks:
+        if not t.id:
+            raise ValidationError("Task has empty id.")
+        if t.id in by_id:
+            raise ValidationError(f"Duplicate task id: {t.id}")
+        if t.duration_min <= 0:
+            raise ValidationError(f"Task {t.id} has non-positive duration_min.")
+        if not t.title:
+            raise ValidationError(f"Task {t.id} has empty title.")
+        idx[t.id] = len(by_id)
+        by_id[t.id] = t
+
+    for t in tasks:
+        for dep in t.depends_on:
+            if dep not in idx:
+                raise ValidationError(f"Task {t.id} depends on missing task id: {dep}")
+            if dep == t.id:
+                raise ValidationError(f"Task {t.id} depends on itself.")
+
+    n = len(by_id)
+    indeg, indptr, indices = _build_csr(by_id, idx)
+    keys = [(t.deadline, -t.priority, t.id) for t in by_id.values()]
+    out = _toposort_core(n, indeg, indptr, indices, keys)
+
+    if len(out) != n:
+        # only pay for the DFS on the error path: it names an actual
+        # cycle, whereas the nodes Kahn leaves with indeg > 0 also
+        # include everything merely downstream of one
+        detect_cycle(by_id)
+        raise CycleError(["<cycle>"])  # unreachable: detect_cycle raises
+    ids = list(by_id)
+    return by_id, [ids[i] for i in out]
 
 
 def _next_work_window_start(dt: datetime, ww_start: time) -> datetime:
@@ -173,8 +253,29 @@ def _work_window_end(dt: datetime, ww_end: time) -> datetime:
     return dt.replace(hour=ww_end.hour, minute=ww_end.minute, second=0, microsecond=0)
 
 
-def _overlap(a_start: datetime, a_end: datetime, b_start: datetime, b_end: datetime) -> bool:
-    return a_start < b_end and b_start < a_end
+def _minutes(td: timedelta) -> int:
+    # integer-only floor of a (non-negative) timedelta to whole minutes,
+    # avoiding the float round-trip of total_seconds()
+    return td.days * 1440 + td.seconds // 60
+
+
+def _blocked_by_day(
+    blocked: List[Tuple[datetime, datetime, str]],
+) -> Dict[date, List[Tuple[datetime, datetime, str]]]:
+    # group blocked intervals by calendar day, splitting the ones that cross
+    # midnight, so each day's window only scans its own intervals
+    by_day: Dict[date, List[Tuple[datetime, datetime, str]]] = {}
+    for bs, be, label in blocked:
+        cur = bs
+        while cur.date() < be.date():
+            midnight = datetime.combine(cur.date() + timedelta(days=1), time.min)
+            by_day.setdefault(cur.date(), []).append((cur, midnight, label))
+            cur = midnight
+        if cur < be:
+            by_day.setdefault(cur.date(), []).append((cur, be, label))
+    for intervals in by_day.values():
+        intervals.sort(key=lambda b: b[0])
+    return by_day
 
 
 def _clip_available_segments(
@@ -182,22 +283,50 @@ def _clip_available_segments(
     window_end: datetime,
     blocked: List[Tuple[datetime, datetime, str]],
 ) -> List[Tuple[datetime, datetime]]:
+    if window_start >= window_end:
+        return []
+    # blocked must be sorted by start time; intervals past the window end
+    # the scan, ones ending before the window are skipped outright
     segs = [(window_start, window_end)]
     for bs, be, _label in blocked:
+        if bs >= window_end:
+            break
+        if be <= window_start:
+            continue
         new_segs: List[Tuple[datetime, datetime]] = []
         for s, e in segs:
-            if not _overlap(s, e, bs, be):
-                new_segs.append((s, e))
-            else:
-                if s < bs:
-                    new_segs.append((s, min(bs, e)))
-                if be < e:
-                    new_segs.append((max(be, s), e))
-        segs = [(s, e) for s, e in new_segs if e > s]
+            # emit the pieces left and right of the blocked interval
+            # unconditionally; non-overlapping cases produce a degenerate
+            # piece on one side that the lo < hi filter drops, so no
+            # separate overlap pre-check is needed
+            lo, hi = s, min(bs, e)
+            if lo < hi:
+                new_segs.append((lo, hi))
+            lo, hi = max(be, s), e
+            if lo < hi:
+                new_segs.append((lo, hi))
+        segs = new_segs
     segs.sort(key=lambda x: x[0])
     return segs
 
 
+def _iter_available_segments(
+    planning_start: datetime,
+    ww_start: time,
+    ww_end: time,
+    blocked_by_day: Dict[date, List[Tuple[datetime, datetime, str]]],
+):
+    # yield free (start, end) segments in chronological order, one work
+    # window at a time, so the scheduler never recomputes a day it has
+    # already consumed
+    cursor = planning_start
+    while True:
+        ws = _next_work_window_start(cursor, ww_start)
+        we = _work_window_end(ws, ww_end)
+        yield from _clip_available_segments(ws, we, blocked_by_day.get(ws.date(), []))
+        cursor = we + timedelta(minutes=1)
+
+
 def schedule(
     planning_start: datetime,
     ww_start: time,
@@ -205,11 +334,21 @@ def schedule(
     blocked: List[Tuple[datetime, datetime, str]],
     tasks: List[Task],
 ) -> Dict[str, object]:
-    by_id = validate_tasks(tasks)
-    detect_cycle(by_id)
-    order = topological_order(by_id)
-
-    scheduled: List[ScheduledBlock] = []
+    by_id, order = _validated_order(tasks)
+
+    blocked_by_day = _blocked_by_day(blocked)
+    segments = _iter_available_segments(planning_start, ww_start, ww_end, blocked_by_day)
+    # a partially used segment is pushed back so the next task resumes in it
+    leftover: Optional[Tuple[datetime, datetime]] = None
+
+    # scheduled blocks as parallel lists (SoA): appending scalars avoids a
+    # dataclass instance per chunk, and the report build zips the columns
+    blk_task_ids: List[str] = []
+    blk_titles: List[str] = []
+    blk_start_isos: List[str] = []
+    blk_end_isos: List[str] = []
+    blk_minutes: List[int] = []
+    blk_ends: List[datetime] = []  # kept as datetimes for the deadline check
     cursor = planning_start
 
     for tid in order:
@@ -217,46 +356,40 @@ def schedule(
         remaining = t.duration_min
 
         while remaining > 0:
-            # ensure we are in a valid work window
-            ws = _next_work_window_start(cursor, ww_start)
-            we = _work_window_end(ws, ww_end)
-
-            # available segments inside today's window after subtracting blocked
-            segments = _clip_available_segments(ws, we, blocked)
-
-            # move cursor to the first segment that is after current cursor
-            placed = False
-            for seg_start, seg_end in segments:
-                start = max(seg_start, cursor)
-                if start >= seg_end:
-                    continue
-
-                minutes_here = int((seg_end - start).total_seconds() // 60)
-                if minutes_here <= 0:
-                    continue
-
-                use = min(remaining, minutes_here)
-                end = start + timedelta(minutes=use)
-
-                scheduled.append(ScheduledBlock(task_id=t.id, title=t.title, start=start, end=end))
-                remaining -= use
-                cursor = end
-                placed = True
-                if remaining == 0:
-                    break
-
-            if not placed:
-                # no room today; advance cursor to after today's window
-                cursor = we + timedelta(minutes=1)
+            if leftover is not None:
+                seg_start, seg_end = leftover
+                leftover = None
+            else:
+                seg_start, seg_end = next(segments)
+
+            start = max(seg_start, cursor)
+            if start >= seg_end:
+                continue
+
+            minutes_here = _minutes(seg_end - start)
+            if minutes_here <= 0:
+                continue
+
+            use = min(remaining, minutes_here)
+            end = start + timedelta(minutes=use)
+
+            blk_task_ids.append(t.id)
+            blk_titles.append(t.title)
+            blk_start_isos.append(start.isoformat())
+            blk_end_isos.append(end.isoformat())
+            blk_minutes.append(use)
+            blk_ends.append(end)
+            remaining -= use
+            cursor = end
+            if end < seg_end:
+                leftover = (end, seg_end)
 
             # deadline check (soft warning; we still schedule but flag it)
             # We check after placement loop in report build.
 
     # Build report with warnings
     warnings: List[str] = []
-    last_end_by_task: Dict[str, datetime] = {}
-    for b in scheduled:
-        last_end_by_task[b.task_id] = b.end
+    last_end_by_task: Dict[str, datetime] = dict(zip(blk_task_ids, blk_ends))
 
     for tid in order:
         t = by_id[tid]
@@ -272,13 +405,15 @@ def schedule(
         "task_order": order,
         "schedule": [
             {
-                "task_id": b.task_id,
-                "title": b.title,
-                "start": b.start.isoformat(),
-                "end": b.end.isoformat(),
-                "minutes": int((b.end - b.start).total_seconds() // 60),
+                "task_id": task_id,
+                "title": title,
+                "start": start_iso,
+                "end": end_iso,
+                "minutes": minutes,
             }
-            for b in scheduled
+            for task_id, title, start_iso, end_iso, minutes in zip(
+                blk_task_ids, blk_titles, blk_start_isos, blk_end_isos, blk_minutes
+            )
         ],
         "warnings": warnings,
     }
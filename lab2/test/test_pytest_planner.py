@@ -93,3 +93,53 @@ def test_schedule_avoids_blocked_overlap_and_can_split_tasks():
         s = dt(b["start"])
         e = dt(b["end"])
         assert not (s < block_e and block_s < e), "Scheduled block overlaps a blocked interval"
+
+
+def test_schedule_rejects_missing_dependency():
+    tasks = [
+        Task("a", "A", 30, dt("2026-02-14T21:00:00"), 3, ("missing",)),
+    ]
+    with pytest.raises(ValidationError) as e:
+        schedule(dt("2026-02-13T18:00:00"), dt("2026-02-13T18:00:00").time(), dt("2026-02-13T23:00:00").time(), [], tasks)
+    assert "missing task id" in str(e.value)
+
+
+def test_schedule_raises_cycle_error_naming_only_cycle_members():
+    # c depends on the a<->b cycle but is not part of it; the reported
+    # path must name the cycle, not nodes merely downstream of it
+    tasks = [
+        Task("a", "A", 10, dt("2026-02-14T21:00:00"), 3, ("b",)),
+        Task("b", "B", 10, dt("2026-02-14T21:00:00"), 3, ("a",)),
+        Task("c", "C", 10, dt("2026-02-14T21:00:00"), 3, ("b",)),
+    ]
+    with pytest.raises(CycleError) as e:
+        schedule(dt("2026-02-13T18:00:00"), dt("2026-02-13T18:00:00").time(), dt("2026-02-13T23:00:00").time(), [], tasks)
+    assert "a" in e.value.cycle_path
+    assert "b" in e.value.cycle_path
+    assert "c" not in e.value.cycle_path
+
+
+def test_schedule_continues_same_day_after_task_finishes_mid_window():
+    # regression: a task finishing mid-window used to push the next task
+    # to the next day's window instead of using the rest of today's
+    req = {
+        "planning_start": "2026-02-13T18:00:00",
+        "work_window": {"start": "18:00", "end": "23:00"},
+        "blocked": [],
+        "tasks": [
+            {"id": "a", "title": "First", "duration_min": 45, "deadline": "2026-02-13T23:00:00", "priority": 3, "depends_on": []},
+            {"id": "b", "title": "Second", "duration_min": 30, "deadline": "2026-02-13T23:00:00", "priority": 3, "depends_on": ["a"]},
+        ]
+    }
+
+    planning_start, ww_start, ww_end, blocked, tasks = parse_request(req)
+    report = schedule(planning_start, ww_start, ww_end, blocked, tasks)
+
+    blocks = report["schedule"]
+    assert len(blocks) == 2
+    assert blocks[0]["task_id"] == "a"
+    assert blocks[0]["end"] == "2026-02-13T18:45:00"
+    assert blocks[1]["task_id"] == "b"
+    assert blocks[1]["start"] == "2026-02-13T18:45:00", "Second task should resume in the same window"
+    assert blocks[1]["end"] == "2026-02-13T19:15:00"
+    assert report["warnings"] == []